@@ -1,17 +1,21 @@
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 import numpy as np
 
 def eval_metrics(y_true, y_pred):
     """
     Calcula métricas básicas de error.
-    
+
+    Una sola resta y dos reducciones NumPy: sin pasar dos veces por la
+    validación/conversión de sklearn (cuenta cuando se llama en bucle,
+    p.ej. sobre folds de backtest).
+
     Parámetros:
     - y_true: array/list de valores reales
     - y_pred: array/list de valores predichos
-    
+
     Devuelve:
     - dict con MAE y RMSE
     """
-    mae = mean_absolute_error(y_true, y_pred)
-    rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-    return {"MAE": mae, "RMSE": rmse}
+    d = np.subtract(np.asarray(y_true, dtype=np.float64),
+                    np.asarray(y_pred, dtype=np.float64))
+    return {"MAE": float(np.abs(d).mean()),
+            "RMSE": float(np.sqrt(np.mean(d * d)))}
@@ -1,3 +1,10 @@
+import os
+
+import matplotlib
+if os.environ.get("MPL_HEADLESS"):
+    # Backend sin display: evita el arranque del backend interactivo
+    # cuando solo vamos a guardar PNGs.
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 def plot_real_vs_pred(df, title="Real vs Predicho", country=None, model=None, savepath=None):
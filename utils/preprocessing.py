@@ -1,22 +1,42 @@
 import pandas as pd
 
-def merge_yields_inflation(yields, wb, country_code, country_name):
+
+def index_inflation_by_country(wb):
+    """
+    Indexa la inflación del Banco Mundial por (Country, Year).
+
+    Calcularlo una vez y pasarlo a merge_yields_inflation evita
+    re-agrupar el frame completo del Banco Mundial en cada país.
+
+    Parámetros:
+    - wb: DataFrame con columnas 'Country', 'Year', 'inflation_yoy'
+
+    Devuelve:
+    - Series 'inflation_yoy' con MultiIndex (Country, Year) ordenado
+    """
+    return wb.set_index(['Country', 'Year'])['inflation_yoy'].sort_index()
+
+
+def merge_yields_inflation(yields, wb, country_code, country_name,
+                           wb_indexed=None):
     """
     Une yields de 10Y con inflación anual para un país dado.
-    
+
     Parámetros:
     - yields: DataFrame con columnas 'Year' y código del país (ej. 'US10')
     - wb: DataFrame con columnas 'Country', 'Year', 'inflation_yoy'
     - country_code: código de 10Y en yields (ej. 'US10')
     - country_name: nombre del país en wb (ej. 'United States')
-    
+    - wb_indexed: salida de index_inflation_by_country (opcional); si se
+      pasa, se reutiliza en vez de reindexar wb en cada llamada
+
     Devuelve:
     - DataFrame con columnas ['yield_10y', 'inflation_yoy']
     """
-    y = yields[['Year', country_code]].rename(columns={country_code:'yield_10y'})
-    i = wb.query("Country == @country_name")[['Year','inflation_yoy']]
-    df = (y.merge(i, on='Year', how='inner')
-            .dropna()
-            .set_index('Year')
-            .sort_index())
-    return df
+    y = yields.set_index('Year')[country_code].rename('yield_10y')
+    if wb_indexed is None:
+        wb_indexed = index_inflation_by_country(wb)
+    i = wb_indexed.loc[country_name].rename('inflation_yoy')
+    # concat sobre el índice entero ya ordenado: una sola alineación en
+    # vez de merge + dropna + set_index + sort_index
+    return pd.concat([y, i], axis=1, join='inner').dropna().sort_index()
@@ -0,0 +1,703 @@
+"""
+Pipeline VAR reutilizable (yield_10y + inflation_yoy).
+
+Agrupa los pasos que repetimos por país en 3_models.ipynb:
+ADF -> diferenciación si hace falta -> selección de rezagos -> ajuste VAR
+-> diagnóstico -> forecast en niveles.
+"""
+import os
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import matplotlib
+if os.environ.get("MPL_HEADLESS"):
+    # Backend sin display: evita el coste de arranque del backend
+    # interactivo cuando solo vamos a guardar PNGs.
+    matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy import stats
+from scipy.linalg import block_diag, cho_factor, cho_solve
+from statsmodels.tsa.adfvalues import mackinnonp
+from statsmodels.tsa.api import VAR
+from statsmodels.tsa.stattools import adfuller
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba es opcional
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(f):
+            return f
+        return wrap
+
+
+@dataclass
+class VARConfig:
+    """Parámetros del pipeline VAR por país."""
+    variables: tuple = ("yield_10y", "inflation_yoy")
+    steps: int = 5
+    maxlags: int = 2
+    crit: str = "aic"
+    deterministic: str = "c"  # tendencia determinista del ADF ('c', 'ct', ...)
+    alpha: float = 0.05
+    # dtype del endog que se pasa al VAR; None lo deja en float64. Con
+    # yields/inflación (~-5..20) float32 da >6 dígitos de margen y reduce
+    # a la mitad el tráfico de memoria al escalar a muchas series.
+    endog_dtype: type = np.float32
+
+
+# Por debajo de este tamaño el coste del ADF es puro overhead de Python
+# (pandas/validación/autolag), no álgebra: usamos el kernel jitted.
+_ADF_FAST_MAXOBS = 50
+
+
+_BUF = threading.local()
+
+
+def _get_adf_buffers(nobs, k):
+    """
+    Buffers reutilizables para la regresión ADF, por hilo y por forma.
+
+    Cientos de ADF seguidos (panel grande, bootstrap) reservan una y otra
+    vez las mismas matrices pequeñas; aquí se reservan una vez por
+    (nobs, k) y el kernel las rellena in situ.
+    """
+    bufs = _BUF.__dict__.setdefault("bufs", {})
+    key = (nobs, k)
+    if key not in bufs:
+        bufs[key] = (np.empty((nobs, k)), np.empty(nobs))
+    return bufs[key]
+
+
+@njit(cache=True, fastmath=True)
+def _adf_stat_fixed_lag(y, lag, with_trend, X, Y):
+    """
+    Estadístico ADF con rezago fijo, calculado directamente sobre arrays.
+
+    X (nobs × k) e Y (nobs) vienen preasignados y se rellenan in situ.
+    Regresa el t-stat del nivel retardado en la regresión
+    Δy_t ~ y_{t-1} + Δy_{t-1..t-lag} + const (+ tendencia).
+    """
+    dy = y[1:] - y[:-1]
+    nobs = Y.size
+    k = X.shape[1]
+    for t in range(nobs):
+        j = t + lag
+        Y[t] = dy[j]
+        X[t, 0] = y[j]
+        for i in range(lag):
+            X[t, 1 + i] = dy[j - 1 - i]
+        X[t, 1 + lag] = 1.0
+        if with_trend:
+            X[t, 2 + lag] = t + 1.0
+    beta, _, _, _ = np.linalg.lstsq(X, Y)
+    resid = Y - X @ beta
+    sigma2 = (resid @ resid) / (nobs - k)
+    xtx_inv = np.linalg.inv(X.T @ X)
+    return beta[0] / np.sqrt(sigma2 * xtx_inv[0, 0])
+
+
+@lru_cache(maxsize=512)
+def _adf_cached(values, regression="c"):
+    """
+    ADF memoizado por los valores de la serie (tupla hashable).
+
+    La búsqueda de autolag ajusta un OLS por rezago candidato, así que
+    repetir el test sobre la misma serie (p.ej. en el bucle por países)
+    es el coste dominante; con la caché solo se paga una vez. En series
+    cortas se salta statsmodels y se usa el kernel numba con rezago fijo
+    (el p-valor sigue saliendo de las tablas de MacKinnon).
+    """
+    y = np.asarray(values, dtype=np.float64)
+    if _HAS_NUMBA and y.size < _ADF_FAST_MAXOBS and regression in ("c", "ct"):
+        # Con ~15 obs anuales un rezago de Δy es lo máximo que dan los datos.
+        lag, with_trend = 1, regression == "ct"
+        nobs = y.size - 1 - lag
+        k = 2 + lag + (1 if with_trend else 0)
+        X, Y = _get_adf_buffers(nobs, k)
+        stat = float(_adf_stat_fixed_lag(y, lag, with_trend, X, Y))
+        pval = float(mackinnonp(stat, regression=regression, N=1))
+        return stat, pval
+    res = adfuller(y, autolag="AIC", regression=regression)
+    return res[0], res[1]
+
+
+def adf_report(x, name, alpha=0.05, regression="c", verbose=True):
+    """
+    Test ADF con salida clara.
+
+    Devuelve (estadístico, p-valor).
+    """
+    x = pd.Series(x).dropna()
+    stat, pval = _adf_cached(tuple(x.values), regression)
+    if verbose:
+        print(f"ADF – {name}: stat={stat:.3f}, p={pval:.4f} -> "
+              f"{'RECHAZA raíz unitaria (estacionaria)' if pval < alpha else 'NO rechaza (posible no estacionaria)'}")
+    return stat, pval
+
+
+def adf_report_multi(df, alpha=0.05, regression="c", lag=1, verbose=True):
+    """
+    Test ADF de todas las columnas con un único least-squares por bloques.
+
+    Apila la regresión ADF de rezago fijo de cada columna en una matriz
+    bloque-diagonal y resuelve un solo lstsq: mismos t-stats que los
+    tests individuales (el ADF no se puede vectorizar entre series, pero
+    su parte de álgebra lineal sí se puede agrupar en una llamada BLAS).
+    p-valores de las tablas de MacKinnon.
+
+    Devuelve dict columna -> (estadístico, p-valor).
+    """
+    cols = list(df.columns)
+    with_trend = regression == "ct"
+    Xs, Ys, metas = [], [], []
+    for col in cols:
+        y = df[col].dropna().to_numpy(np.float64)
+        dy = np.diff(y)
+        nobs = dy.size - lag
+        k = 2 + lag + (1 if with_trend else 0)
+        X = np.empty((nobs, k))
+        X[:, 0] = y[lag:-1]
+        for i in range(lag):
+            X[:, 1 + i] = dy[lag - 1 - i: dy.size - 1 - i]
+        X[:, 1 + lag] = 1.0
+        if with_trend:
+            X[:, 2 + lag] = np.arange(1, nobs + 1)
+        Xs.append(X)
+        Ys.append(dy[lag:])
+        metas.append((nobs, k))
+
+    Xbig = block_diag(*Xs)
+    Ybig = np.concatenate(Ys)
+    beta = np.linalg.lstsq(Xbig, Ybig, rcond=None)[0]
+    resid = Ybig - Xbig @ beta
+
+    out = {}
+    r0 = c0 = 0
+    for col, X, (nobs, k) in zip(cols, Xs, metas):
+        b = beta[c0:c0 + k]
+        e = resid[r0:r0 + nobs]
+        sigma2 = (e @ e) / (nobs - k)
+        xtx_inv = np.linalg.inv(X.T @ X)
+        stat = float(b[0] / np.sqrt(sigma2 * xtx_inv[0, 0]))
+        pval = float(mackinnonp(stat, regression=regression, N=1))
+        out[col] = (stat, pval)
+        if verbose:
+            print(f"ADF – {col}: stat={stat:.3f}, p={pval:.4f} -> "
+                  f"{'RECHAZA raíz unitaria (estacionaria)' if pval < alpha else 'NO rechaza (posible no estacionaria)'}")
+        r0 += nobs
+        c0 += k
+    return out
+
+
+def difference_if_needed(df, config=None, check_after=False):
+    """
+    Comprueba estacionariedad por ADF y diferencia una vez si hace falta.
+
+    Corta en cuanto aparece la primera serie no estacionaria (con una
+    basta: diferenciamos todo el sistema) y solo repite el ADF sobre las
+    diferencias si check_after=True.
+
+    Devuelve (df_transformado, diferenciado: bool).
+    """
+    config = config or VARConfig()
+    regression = config.deterministic[:1]
+    needs_diff = False
+    for col in df.columns:
+        _, pval = adf_report(df[col], col, alpha=config.alpha,
+                             regression=regression)
+        if pval >= config.alpha:
+            needs_diff = True
+            break
+    if not needs_diff:
+        return df, False
+    df_diff = df.diff().dropna()
+    if check_after:
+        for col in df_diff.columns:
+            adf_report(df_diff[col], f"Δ{col}", alpha=config.alpha,
+                       regression=regression)
+    return df_diff, True
+
+
+def ensure_datetime_index(df, year_col="Year"):
+    """
+    Pasa la columna de año a índice datetime anual ordenado.
+
+    Idempotente: si el índice ya es DatetimeIndex devuelve el frame tal
+    cual, así el driver puede convertir una sola vez por país sin que las
+    llamadas internas repitan el to_datetime + sort.
+    """
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df
+    df = df.copy()
+    # Aritmética vectorial int64 -> datetime64 (años desde 1970), sin el
+    # strptime por fila que dispara pd.to_datetime con format="%Y".
+    years = df[year_col].to_numpy(np.int64)
+    df["Date"] = np.asarray(years - 1970,
+                            dtype="datetime64[Y]").astype("datetime64[ns]")
+    return df.set_index("Date").sort_index()
+
+
+def build_panel(df, year_col="Year"):
+    """
+    Convierte el panel largo en un frame MultiIndex (Country, Date) ordenado.
+
+    Con el índice ordenado, extraer un país es panel.xs(country): una
+    búsqueda binaria sobre el índice en vez de una máscara booleana sobre
+    todo el frame por cada país.
+    """
+    df = ensure_datetime_index(df, year_col=year_col)
+    return df.set_index("Country", append=True).swaplevel().sort_index()
+
+
+def _country_slice(df, country, country_groups=None):
+    """Extrae el slice de un país según el formato del panel."""
+    if country_groups is not None:
+        return country_groups[country]
+    if isinstance(df.index, pd.MultiIndex):
+        return df.xs(country, level="Country")
+    return df[df["Country"] == country]
+
+
+# Penalización por parámetro de cada criterio de información (por obs.)
+_IC_PENALTY = {
+    "aic": lambda nobs: 2.0 / nobs,
+    "bic": lambda nobs: np.log(nobs) / nobs,
+    "hqic": lambda nobs: 2.0 * np.log(np.log(nobs)) / nobs,
+}
+
+
+def select_lags(df, maxlags=2, crit="aic"):
+    """
+    Selecciona el nº de rezagos del VAR según el criterio dado.
+
+    En vez de select_order (que re-ajusta el VAR reconstruyendo la matriz
+    de rezagos en cada candidato), construye la matriz retardada una sola
+    vez con sliding_window_view y evalúa cada p recortando columnas:
+    misma muestra efectiva para todos los candidatos, un solo escaneo de
+    los datos.
+    """
+    if crit not in _IC_PENALTY:
+        # criterios no soportados (p.ej. 'fpe'): delegamos en statsmodels
+        sel = VAR(df).select_order(maxlags=maxlags)
+        best = getattr(sel, crit)
+        return 1 if best is None or best < 1 else best
+
+    y = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+    T, k = y.shape
+    win = np.lib.stride_tricks.sliding_window_view(y, maxlags + 1, axis=0)
+    Y = win[:, :, -1]
+    nobs = Y.shape[0]
+    lags = np.concatenate([win[:, :, -1 - j] for j in range(1, maxlags + 1)],
+                          axis=1)
+    penalty = _IC_PENALTY[crit](nobs)
+
+    best_lag, best_ic = 1, np.inf
+    for p in range(1, maxlags + 1):
+        X = np.hstack([np.ones((nobs, 1)), lags[:, :k * p]])
+        xtx = X.T @ X
+        try:
+            beta = cho_solve(cho_factor(xtx), X.T @ Y)
+        except np.linalg.LinAlgError:
+            beta = np.linalg.lstsq(X, Y, rcond=None)[0]
+        resid = Y - X @ beta
+        sigma_mle = resid.T @ resid / nobs
+        sign, logdet = np.linalg.slogdet(sigma_mle)
+        if sign <= 0:
+            continue
+        ic = logdet + penalty * k * (k * p + 1)
+        if ic < best_ic:
+            best_lag, best_ic = p, ic
+    return best_lag
+
+
+@dataclass
+class VARResultsPack:
+    """Resultado empaquetado del ajuste VAR de un país."""
+    country: str
+    model_fit: object
+    best_lag: int
+    variables: tuple
+    differenced: bool
+    diagnostics: dict = field(default_factory=dict)
+    _irf_cache: dict = field(default_factory=dict, repr=False)
+
+    def irf(self, horizon):
+        """
+        IRF del VAR, cacheada por horizonte.
+
+        model_fit.irf recalcula el tensor completo (horizonte × k × k)
+        en cada llamada; aquí se calcula una vez y se comparte entre
+        gráficos y análisis posteriores.
+        """
+        if horizon not in self._irf_cache:
+            self._irf_cache[horizon] = self.model_fit.irf(horizon)
+        return self._irf_cache[horizon]
+
+
+def fit_var_for_country(df, country, config=None, country_groups=None,
+                        diagnostics=("lb", "jb", "dw", "stability")):
+    """
+    Ajusta un VAR para un país del panel (columnas Country/Year + variables).
+
+    Acepta el panel largo (columna Country), el panel MultiIndex de
+    build_panel, o un dict country_groups (p.ej. de un groupby previo)
+    para evitar re-escanear el panel completo con una máscara booleana.
+
+    diagnostics elige qué tests calcular ('lb', 'jb', 'dw', 'stability');
+    True equivale a todos y False a ninguno, útil en flujos que solo
+    quieren el forecast y no pagan Ljung-Box y compañía.
+
+    Devuelve un VARResultsPack con el ajuste y el diagnóstico pedido.
+    """
+    config = config or VARConfig()
+    if diagnostics is True:
+        diagnostics = ("lb", "jb", "dw", "stability")
+    wanted = set(diagnostics) if diagnostics else set()
+    df_c = ensure_datetime_index(_country_slice(df, country, country_groups))
+    df_xy = df_c[list(config.variables)].astype(float).dropna()
+    df_xy_t, differenced = difference_if_needed(df_xy, config)
+    # El ADF/MacKinnon ya corrió arriba en float64; el endog del VAR se
+    # puede rebajar (el diagnóstico de residuos sigue en float64).
+    if config.endog_dtype is not None:
+        df_xy_t = df_xy_t.astype(config.endog_dtype)
+
+    # Cap defensivo de rezagos según nº de observaciones (ver 3_models.ipynb)
+    N = len(df_xy_t)
+    k = df_xy_t.shape[1]
+    safe_max = max(1, min(config.maxlags, (N - 5) // k))
+    if safe_max < config.maxlags:
+        print(f"[{country}] maxlags reducido de {config.maxlags} a {safe_max} por N={N}")
+
+    best_lag = select_lags(df_xy_t, maxlags=safe_max, crit=config.crit)
+    fit = VAR(df_xy_t).fit(best_lag)
+
+    # Diagnóstico calculado en bloque sobre el array de residuos: un solo
+    # pase por columna, y solo los tests que pide el caller.
+    diag = {}
+    if wanted & {"lb", "jb", "dw"}:
+        resid = fit.resid
+        r = resid.to_numpy(dtype=np.float64)
+        cols = list(resid.columns)
+        n = r.shape[0]
+        d = r - r.mean(axis=0)
+
+        if "dw" in wanted:
+            dw_vec = (np.diff(r, axis=0) ** 2).sum(axis=0) / (r ** 2).sum(axis=0)
+            diag["durbin_watson"] = dict(zip(cols, dw_vec.tolist()))
+
+        if "jb" in wanted:
+            var = (d * d).mean(axis=0)
+            skew = (d ** 3).mean(axis=0) / var ** 1.5
+            kurt = (d ** 4).mean(axis=0) / var ** 2
+            jb_stat = n / 6.0 * (skew ** 2 + (kurt - 3.0) ** 2 / 4.0)
+            diag["jarque_bera"] = dict(zip(cols, stats.chi2.sf(jb_stat, 2).tolist()))
+
+        if "lb" in wanted:
+            # Ljung-Box vectorizado entre columnas (bucle solo en rezagos)
+            lb_lag = max(1, min(10, n - 2, 2 * best_lag))
+            denom = (d * d).sum(axis=0)
+            lb_stat = np.zeros(len(cols))
+            for lag in range(1, lb_lag + 1):
+                rho = (d[lag:] * d[:-lag]).sum(axis=0) / denom
+                lb_stat += rho ** 2 / (n - lag)
+            lb_stat *= n * (n + 2)
+            diag["ljung_box"] = dict(zip(cols, stats.chi2.sf(lb_stat, lb_lag).tolist()))
+
+    if "stability" in wanted:
+        mod = _max_eig_modulus(fit)
+        diag["max_eig_modulus"] = mod
+        diag["stable"] = bool(mod < 1)
+
+    return VARResultsPack(country=country, model_fit=fit, best_lag=best_lag,
+                          variables=tuple(config.variables),
+                          differenced=differenced, diagnostics=diag)
+
+
+def _max_eig_modulus(fit):
+    """
+    Módulo máximo de los autovalores de la matriz companion del VAR.
+
+    Equivale al test |raíz| > 1 sobre fit.roots (las raíces son los
+    recíprocos de estos autovalores) pero sin el envoltorio Python de
+    statsmodels: companion construida una vez y una sola llamada a
+    eigvals. Estable ⟺ módulo máximo < 1.
+    """
+    A = fit.coefs  # (p, k, k)
+    p, k, _ = A.shape
+    C = np.zeros((k * p, k * p))
+    C[:k, :] = np.hstack(A)
+    if p > 1:
+        C[k:, :-k] = np.eye(k * (p - 1))
+    return float(np.abs(np.linalg.eigvals(C)).max())
+
+
+# Kernel de forecast especializado para el caso común p=1, k=2, generado
+# en el import: la recursión queda como aritmética escalar desenrollada,
+# sin el bucle Python de productos matriz-vector de statsmodels.
+_P1_K2_SRC = '''
+def _forecast_p1_k2(y, A, c, steps, out):
+    y0 = y[-1, 0]
+    y1 = y[-1, 1]
+    a00 = A[0, 0, 0]; a01 = A[0, 0, 1]
+    a10 = A[0, 1, 0]; a11 = A[0, 1, 1]
+    c0 = c[0]; c1 = c[1]
+    for s in range(steps):
+        t0 = a00 * y0 + a01 * y1 + c0
+        t1 = a10 * y0 + a11 * y1 + c1
+        out[s, 0] = t0
+        out[s, 1] = t1
+        y0 = t0
+        y1 = t1
+'''
+_codegen_ns = {}
+exec(compile(_P1_K2_SRC, "<var_pipeline codegen>", "exec"), _codegen_ns)
+_forecast_p1_k2 = _codegen_ns["_forecast_p1_k2"]
+
+# despacho (k_ar, neqs) -> kernel especializado
+_SPECIALIZED_FORECAST = {(1, 2): _forecast_p1_k2}
+
+
+def _raw_forecast(results, steps):
+    """
+    Forecast crudo del VAR (en la escala en la que se ajustó).
+
+    Para (p, k) con kernel especializado y tendencia constante se usa la
+    versión desenrollada; el resto va por fit.forecast.
+    """
+    fit = results.model_fit
+    kernel = _SPECIALIZED_FORECAST.get((fit.k_ar, fit.neqs))
+    if kernel is not None and getattr(fit, "k_trend", None) == 1:
+        vals = np.empty((steps, fit.neqs))
+        kernel(np.asarray(fit.endog[-fit.k_ar:], dtype=np.float64),
+               fit.coefs, fit.intercept, steps, vals)
+    else:
+        vals = fit.forecast(fit.endog[-fit.k_ar:], steps=steps)
+    return pd.DataFrame(vals, columns=list(results.variables))
+
+
+@njit(cache=True, parallel=True)
+def _cumulate_levels(last_levels, diffs, out):
+    """
+    Acumulación de niveles en bloque: (K países, S pasos, V variables).
+
+    Un solo kernel paralelo en vez de K cumsum sueltos por país.
+    """
+    K, S, V = diffs.shape
+    for k in prange(K):
+        for v in range(V):
+            acc = last_levels[k, v]
+            for s in range(S):
+                acc += diffs[k, s, v]
+                out[k, s, v] = acc
+
+
+def cumulate_levels(last_levels, diffs):
+    """
+    Reconstruye niveles para varios países a la vez.
+
+    last_levels: array (K, V); diffs: array (K, S, V).
+    Devuelve array (K, S, V) de niveles.
+    """
+    out = np.empty_like(diffs)
+    if _HAS_NUMBA:
+        _cumulate_levels(last_levels, diffs, out)
+    else:
+        out[:] = np.cumsum(diffs, axis=1) + last_levels[:, None, :]
+    return out
+
+
+def forecast_levels(results, last_levels, steps=5):
+    """
+    Forecast del VAR reconstruido en niveles.
+
+    Si el modelo se ajustó en diferencias, acumula los incrementos sobre
+    el último nivel observado; si no, devuelve el forecast tal cual.
+    """
+    fcst = _raw_forecast(results, steps)
+    if not results.differenced:
+        return fcst
+    # Niveles = último nivel observado + suma acumulada de los incrementos,
+    # en una sola llamada vectorizada en vez de un bucle paso a paso.
+    levels = np.cumsum(fcst.values, axis=0) + last_levels.values[None, :]
+    out = pd.DataFrame(levels, columns=list(results.variables))
+    return out
+
+
+def plot_irf(results, horizon=8, savepath=None):
+    """
+    Dibuja las IRF ortogonalizadas del VAR ajustado en una sola figura
+    (rejilla k × k de subplots en vez de k² figuras sueltas).
+    """
+    irf = results.irf(horizon)
+    names = list(results.variables)
+    k = len(names)
+    fig, axes = plt.subplots(k, k, figsize=(4 * k, 3 * k), squeeze=False)
+    for i, resp in enumerate(names):
+        for j, imp in enumerate(names):
+            ax = axes[i, j]
+            ax.plot(irf.orth_irfs[:, i, j], marker="o")
+            ax.axhline(0, color="gray", lw=.8)
+            ax.set_title(f"{imp} → {resp}")
+            ax.grid(alpha=.3)
+    axes[-1, 0].set_xlabel("Horizonte (años)")
+    fig.suptitle(f"{results.country} – IRF ortogonalizadas")
+    fig.tight_layout()
+    if savepath:
+        slug = results.country.lower().replace(" ", "_")
+        fig.savefig(f"{savepath}/irf_{slug}.png", dpi=140, bbox_inches="tight")
+    else:
+        plt.show()
+
+
+def _fit_one_country(df, country, config, country_groups=None,
+                     diagnostics=True):
+    """
+    Trabajo por país sin gráficos (apto para despachar a un worker).
+
+    Devuelve (VARResultsPack, DataFrame de forecast indexado por año).
+    """
+    if country_groups is None:
+        country_groups = {country: _country_slice(df, country)}
+    pack = fit_var_for_country(df, country, config,
+                               country_groups=country_groups,
+                               diagnostics=diagnostics)
+    df_c = ensure_datetime_index(country_groups[country])
+    last_levels = df_c[list(config.variables)].astype(float).dropna().iloc[-1]
+    fcst_levels = forecast_levels(pack, last_levels, steps=config.steps)
+    last_year = df_c.index.max().year
+    fcst_levels.index = range(last_year + 1, last_year + 1 + config.steps)
+    return pack, fcst_levels
+
+
+def _fit_one_country_raw(df, country, config, country_groups=None,
+                         diagnostics=True):
+    """
+    Variante de _fit_one_country que no acumula niveles: devuelve el
+    forecast crudo y el último nivel observado para que el driver haga la
+    acumulación de todos los países en un solo kernel.
+    """
+    if country_groups is None:
+        country_groups = {country: _country_slice(df, country)}
+    pack = fit_var_for_country(df, country, config,
+                               country_groups=country_groups,
+                               diagnostics=diagnostics)
+    df_c = ensure_datetime_index(country_groups[country])
+    last_levels = df_c[list(config.variables)].astype(float).dropna().iloc[-1]
+    fcst = _raw_forecast(pack, config.steps)
+    last_year = int(df_c.index.max().year)
+    return pack, fcst, last_levels, last_year
+
+
+def _plot_country_forecast(hist, fcst_levels, country, savepath=None):
+    """
+    Histórico + forecast de un país en una sola figura (un subplot por
+    variable en vez de una figura nueva por variable).
+    """
+    last_year = int(hist.index.year.max())
+    ncols = len(fcst_levels.columns)
+    fig, axes = plt.subplots(1, ncols, figsize=(6 * ncols, 4), squeeze=False)
+    for ax, col in zip(axes[0], fcst_levels.columns):
+        ax.plot(hist.index.year, hist[col], marker="o", label=f"{col} (hist.)")
+        ax.plot(fcst_levels.index, fcst_levels[col], "--", marker="x",
+                label=f"{col} (fcst)")
+        ax.axvline(last_year, color="gray", linestyle="--", alpha=.7)
+        ax.set_title(col)
+        ax.set_xlabel("Year")
+        ax.set_ylabel("%")
+        ax.legend()
+        ax.grid(alpha=.3)
+    fig.suptitle(f"{country} – histórico + forecast VAR")
+    fig.tight_layout()
+    if savepath:
+        slug = country.lower().replace(" ", "_")
+        fig.savefig(f"{savepath}/forecast_{slug}.png",
+                    dpi=140, bbox_inches="tight")
+    else:
+        plt.show()
+
+
+def quick_var_country_report(df, country, config=None, plot=True,
+                             country_groups=None, savepath=None,
+                             diagnostics=True):
+    """
+    Informe VAR rápido para un país: ajuste + diagnóstico + forecast en niveles.
+
+    country_groups permite reutilizar una partición previa del panel por
+    país (ver run_var_reports) y así evitar dos escaneos completos.
+
+    Devuelve (VARResultsPack, DataFrame de forecast indexado por año).
+    """
+    config = config or VARConfig()
+    if country_groups is None:
+        country_groups = {country: _country_slice(df, country)}
+    pack, fcst_levels = _fit_one_country(df, country, config,
+                                         country_groups=country_groups,
+                                         diagnostics=diagnostics)
+
+    if plot:
+        df_c = ensure_datetime_index(country_groups[country])
+        hist = df_c[list(config.variables)].astype(float).dropna()
+        _plot_country_forecast(hist, fcst_levels, country, savepath=savepath)
+
+    return pack, fcst_levels
+
+
+def run_var_reports(df, countries=None, config=None, n_jobs=-1, plot=True,
+                    savepath=None, diagnostics=True):
+    """
+    Informe VAR para varios países en paralelo (un worker por país).
+
+    Cada ajuste es independiente, así que se despacha con joblib; los
+    gráficos se dibujan en el proceso principal (matplotlib no es seguro
+    en los workers). El panel se parte por país una sola vez para no
+    re-filtrar el DataFrame completo dentro de cada worker.
+
+    Devuelve dict país -> (VARResultsPack, DataFrame de forecast).
+    """
+    config = config or VARConfig()
+    # Partición + conversión a índice datetime una sola vez por país;
+    # todo lo de dentro (fit, last levels, gráficos) reutiliza el slice.
+    if isinstance(df.index, pd.MultiIndex):
+        groups = {c: g.droplevel("Country")
+                  for c, g in df.groupby(level="Country", sort=False)}
+    else:
+        groups = {c: ensure_datetime_index(g)
+                  for c, g in df.groupby("Country", sort=False)}
+    if countries is None:
+        countries = list(groups)
+
+    fitted = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_fit_one_country_raw)(groups[c], c, config,
+                                      country_groups={c: groups[c]},
+                                      diagnostics=diagnostics)
+        for c in countries
+    )
+
+    # Acumulación de niveles de todos los países diferenciados en un solo
+    # kernel (numba paralelo) en vez de un cumsum por país.
+    diff_idx = [i for i, (pack, _, _, _) in enumerate(fitted)
+                if pack.differenced]
+    if diff_idx:
+        diffs = np.stack([fitted[i][1].to_numpy(np.float64) for i in diff_idx])
+        lasts = np.stack([fitted[i][2].to_numpy(np.float64) for i in diff_idx])
+        levels = cumulate_levels(lasts, diffs)
+        for pos, i in enumerate(diff_idx):
+            fitted[i][1].iloc[:, :] = levels[pos]
+
+    out = {}
+    for country, (pack, fcst_levels, _, last_year) in zip(countries, fitted):
+        fcst_levels.index = range(last_year + 1, last_year + 1 + config.steps)
+        out[country] = (pack, fcst_levels)
+        if plot:
+            hist = groups[country][list(config.variables)].astype(float).dropna()
+            _plot_country_forecast(hist, fcst_levels, country,
+                                   savepath=savepath)
+    return out